@@ -7,3 +7,7 @@ LOG_LEVEL = 'DEBUG'  # or 'INFO, WARNING, ERROR, CRITICAL'
 WEBHOOKS_ENABLED = {
     "plex": True,
 }
+
+# Discord client profile
+DISCORD_SEND_ONLY = False  # Only the guilds intent, no message/member caches, no chunking
+DISCORD_STATS_INTERVAL = 0  # Seconds between RSS / gateway events-per-second log lines, 0 to disable
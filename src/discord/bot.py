@@ -1,25 +1,54 @@
+import asyncio
+import os
+import sys
+import time
+from collections import Counter
+
 import discord
 from discord.ext import commands
 
+from config.config import DISCORD_SEND_ONLY, DISCORD_STATS_INTERVAL
 from utils.custom_logger import logger
 
 class DiscordBot:
-    def __init__(self, token):
-        intents = discord.Intents.default()
-        intents.message_content = True
-
+    def __init__(self, token, send_only=DISCORD_SEND_ONLY, stats_interval=DISCORD_STATS_INTERVAL):
         self.token = token
+        self.send_only = send_only
+        self.stats_interval = stats_interval
+        self.channels = {}
+        self.event_counts = Counter()
+        self.stats_task = None
         self.bot = commands.Bot(
-            command_prefix="!",
-            intents=intents,
             activity=discord.Activity(
                 type=discord.ActivityType.watching,
                 name="127.0.0.1"
-            )
+            ),
+            **self.client_options()
         )
 
         # Register event listeners
         self.bot.add_listener(self.on_ready)
+        if self.stats_interval:
+            self.bot.add_listener(self.on_socket_event_type)
+
+    ## Build the client options for the selected profile
+    def client_options(self):
+        if not self.send_only:
+            intents = discord.Intents.default()
+            intents.message_content = True
+            return {"command_prefix": "!", "intents": intents}
+
+        # The bot only posts embeds, so it only needs guilds to resolve channels.
+        # Without message content a text prefix can't work, so only react to mentions.
+        intents = discord.Intents.none()
+        intents.guilds = True
+        return {
+            "command_prefix": commands.when_mentioned,
+            "intents": intents,
+            "max_messages": None,
+            "chunk_guilds_at_startup": False,
+            "member_cache_flags": discord.MemberCacheFlags.none(),
+        }
 
     ## Start the bot
     async def start(self):
@@ -27,21 +56,95 @@ class DiscordBot:
             await self.bot.start(self.token)
         except Exception as e:
             logger.error(f"Error starting the bot: {e}")
+        finally:
+            if self.stats_task:
+                self.stats_task.cancel()
 
     ## Event listener for when the bot is ready
     async def on_ready(self):
         logger.info(
             f'Logged in as {self.bot.user.name} ({self.bot.user.id}) and is ready!'
+            f' (send-only profile: {self.send_only})'
         )
+        # on_ready fires again after reconnects, only start the stats loop once
+        if self.stats_interval and not self.stats_task:
+            logger.info(f"Discord stats: startup events {self.format_event_counts()}")
+            self.event_counts.clear()
+            self.stats_task = asyncio.create_task(self.log_stats())
+
+    ## Event listener counting every gateway event received, per event type
+    async def on_socket_event_type(self, event_type):
+        self.event_counts[event_type] += 1
+
+    ## Periodically log RSS and gateway events per second, per event type
+    async def log_stats(self):
+        last = time.monotonic()
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            now = time.monotonic()
+            elapsed = now - last
+            rate = sum(self.event_counts.values()) / elapsed
+            breakdown = self.format_event_counts(elapsed)
+            self.event_counts.clear()
+            last = now
+            logger.info(f"Discord stats: {self.rss()}, {rate:.2f} gateway events/s {breakdown}")
+
+    ## Format the event counters, as rates when an elapsed time is given
+    def format_event_counts(self, elapsed=None):
+        if not self.event_counts:
+            return "(none)"
+        parts = []
+        for event_type, count in self.event_counts.most_common():
+            value = f"{count / elapsed:.2f}/s" if elapsed else str(count)
+            parts.append(f"{event_type}={value}")
+        return f"({', '.join(parts)})"
+
+    ## Resident set size of this process, current where the platform exposes it
+    def rss(self):
+        try:
+            with open("/proc/self/statm") as statm:
+                pages = int(statm.read().split()[1])
+            return f"RSS {pages * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2:.1f} MB"
+        except (OSError, ValueError, IndexError, AttributeError):
+            pass
+        try:
+            import resource
+        except ImportError:
+            return "RSS unavailable"
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+        if sys.platform == "darwin":
+            max_rss /= 1024
+        # Peak only, so compare runs at the same uptime
+        return f"peak RSS {max_rss / 1024:.1f} MB"
+
+    ## Resolve a channel, caching only the gateway-maintained objects by ID
+    async def resolve_channel(self, channel_id):
+        channel = self.channels.get(channel_id)
+        if channel:
+            return channel
+        channel = self.bot.get_channel(channel_id)
+        if channel:
+            self.channels[channel_id] = channel
+            return channel
+        # Not in the gateway cache yet (e.g. before on_ready), fetch without caching
+        try:
+            return await self.bot.fetch_channel(channel_id)
+        except discord.HTTPException as e:
+            logger.error(f"Error fetching channel {channel_id}: {e}")
+            return None
 
     ## Post a single embed to a channel
     async def dispatch_embed(self, channel_id, embed):
-        channel = self.bot.get_channel(channel_id)
+        channel = await self.resolve_channel(channel_id)
         if not channel:
             logger.error(f"Channel {channel_id} not found")
             return
         try:
             await channel.send(embed=embed)
             logger.info(f"Embed dispatched with title: {embed.title}")
+        except (discord.NotFound, discord.Forbidden) as e:
+            self.channels.pop(channel_id, None)
+            logger.error(f"Error dispatching embed: {e}")
         except Exception as e:
-            logger.error(f"Error dispatching embed: {e}")
\ No newline at end of file
+            logger.error(f"Error dispatching embed: {e}")
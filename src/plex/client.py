@@ -276,7 +276,7 @@ class PlexWebhookHandler:
     async def dispatch_embed(self):
         embed = self.generate_embed()
         channel_id = self.determine_channel_id()
-        channel = self.discord_bot.bot.get_channel(channel_id)
+        channel = await self.discord_bot.resolve_channel(channel_id)
         if channel:
             await embed.send_embed(channel)
         else: